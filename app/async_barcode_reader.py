@@ -0,0 +1,277 @@
+"""Asynchronous barcode reader that talks to the Aspose Barcode Cloud REST API directly."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from app import token_cache
+from app.barcode_reader import (
+    _DEFAULT_BARCODE_TYPES,
+    _TRANSIENT_STATUSES,
+    RecognizedBarcode,
+    _encode_image_b64,
+    _ensure_readable,
+    _load_cached_results,
+    _open_image,
+    _recognition_mode,
+    _result_cache_key,
+    _store_cached_results,
+)
+
+try:  # pragma: no cover - optional dependency
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - HTTP/2 support is an optional extra of httpx
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:  # pragma: no cover
+    _HTTP2 = False
+
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BASE_URL = "https://api.aspose.cloud/v4.0"
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 8.0
+
+
+class AsyncBarcodeReader:
+    """Scans many local images concurrently over a single HTTP/2 connection pool.
+
+    The synchronous SDK is only used to obtain the OAuth access token; recognition requests
+    are sent with ``httpx`` so that hundreds of them can be in flight without a thread each.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        *,
+        base_url: Optional[str] = None,
+        max_concurrency: int = 50,
+        min_interval: float = 0.0,
+    ) -> None:
+        if httpx is None:
+            raise ImportError("AsyncBarcodeReader requires the optional 'httpx' package")
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._base_url = (base_url or _DEFAULT_BASE_URL).rstrip("/")
+        self._base_url_override = base_url
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._min_interval = min_interval
+        self._next_start = 0.0
+        # Token loaded from the on-disk cache, kept to recognise requests that were rejected
+        # because of it (several may be in flight when it turns out to be stale).
+        self._cached_token = token_cache.load_token(client_id)
+        self._token: Optional[str] = self._cached_token
+        self._token_lock = asyncio.Lock()
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+        logger.info(
+            "AsyncBarcodeReader ready (HTTP/%s, up to %d concurrent request(s))",
+            "2" if _HTTP2 else "1.1",
+            max_concurrency,
+        )
+
+    async def scan_image_async(
+        self,
+        image_path: Path | str,
+        *,
+        barcode_types: Optional[Iterable[str]] = None,
+        preset: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> List[RecognizedBarcode]:
+        """Recognise barcodes from a local image.
+
+        Args:
+            image_path: Path to the image that contains barcodes.
+            barcode_types: Optional iterable with the list of symbologies to search for.
+            preset: Optional recognition mode sent as ``recognitionMode``: ``Fast``,
+                ``Normal`` or ``Excellent`` (``HighPerformance`` and ``HighQuality`` are
+                accepted as ``Fast`` and ``Excellent``).
+            use_cache: Reuse results of a previous scan of identical image content with the
+                same options instead of calling the API again.
+        """
+
+        path = Path(image_path)
+        logger.info("Scanning image %s", path)
+        filters = list(barcode_types) if barcode_types else None
+        mode = _recognition_mode(preset)
+        async with self._semaphore:
+            cache_key, cached, body = await asyncio.to_thread(
+                self._prepare, path, filters, mode, use_cache
+            )
+            if cached is not None:
+                logger.info("Using cached result for image %s", path)
+                return cached
+            endpoint = "/barcode/recognize-body" if filters or mode else "/barcode/scan-body"
+            await self._pace()
+            payload = await self._post(endpoint, body)
+
+        results = [
+            RecognizedBarcode(
+                value=item.get("barcodeValue", ""),
+                symbology=item.get("type", ""),
+                confidence=item.get("confidence"),
+            )
+            for item in payload.get("barcodes") or []
+        ]
+        logger.debug("Scan produced %d result(s)", len(results))
+        if cache_key is not None:
+            await asyncio.to_thread(_store_cached_results, cache_key, results)
+        return results
+
+    async def scan_images_async(
+        self,
+        image_paths: Iterable[Path | str],
+        *,
+        barcode_types: Optional[Iterable[str]] = None,
+        preset: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> List[List[RecognizedBarcode]]:
+        """Recognise barcodes from several images; results follow the order of the input.
+
+        Every path is checked before the first request is sent, and once one scan fails the
+        scans still in flight are cancelled.
+        """
+        paths = list(image_paths)
+        filters = list(barcode_types) if barcode_types is not None else None
+        _recognition_mode(preset)  # reject an unknown preset before any request is sent
+        await asyncio.to_thread(_ensure_readable, paths)
+        tasks = [
+            asyncio.ensure_future(
+                self.scan_image_async(
+                    path, barcode_types=filters, preset=preset, use_cache=use_cache
+                )
+            )
+            for path in paths
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Do not leave requests running against a client that is about to be closed.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    # ------------------------------------------------------------------
+    def _prepare(
+        self, path: Path, filters: Optional[List[str]], mode: Optional[str], use_cache: bool
+    ) -> Tuple[Optional[str], Optional[List[RecognizedBarcode]], bytes]:
+        """Hash, look up and encode an image. Runs in a worker thread, off the event loop."""
+        with _open_image(path) as image:
+            cache_key = None
+            if use_cache:
+                cache_key = _result_cache_key(
+                    image, filters, mode, self._base_url_override, "rest"
+                )
+                cached = _load_cached_results(cache_key)
+                if cached is not None:
+                    return cache_key, cached, b""
+            encoded = _encode_image_b64(image)
+
+        # Base64 needs no JSON escaping, so the encoded image is spliced into the request
+        # body as bytes instead of being decoded to ``str`` and re-encoded by a serialiser.
+        fields = {}
+        if filters or mode:
+            fields["barcodeTypes"] = filters or _DEFAULT_BARCODE_TYPES
+        if mode:
+            fields["recognitionMode"] = mode
+        head = json.dumps(fields)[:-1] + (", " if fields else "") + '"fileBase64": "'
+        return cache_key, None, b"".join((head.encode("utf-8"), encoded, b'"}'))
+
+    async def _pace(self) -> None:
+        """Wait until at least ``min_interval`` seconds have passed since the previous start."""
+        if self._min_interval <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _post(self, endpoint: str, body: bytes) -> dict:
+        url = self._base_url + endpoint
+        for attempt in range(_MAX_ATTEMPTS):
+            token = await self._get_token()
+            response = await self._client.post(
+                url,
+                content=body,
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+            if response.status_code == 401 and token == self._cached_token:
+                logger.info("Cached access token was rejected; requesting a new one")
+                await self._invalidate_token(token)
+                continue
+            if response.status_code in _TRANSIENT_STATUSES and attempt + 1 < _MAX_ATTEMPTS:
+                delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt) + random.uniform(0, 0.25)
+                logger.warning(
+                    "Transient API error (%s); retrying in %.2fs (attempt %d of %d)",
+                    response.status_code,
+                    delay,
+                    attempt + 2,
+                    _MAX_ATTEMPTS,
+                )
+                await asyncio.sleep(delay)
+                continue
+            response.raise_for_status()
+            return response.json()
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_token(self) -> str:
+        if self._token:
+            return self._token
+        async with self._token_lock:
+            if not self._token:
+                self._token = await asyncio.to_thread(self._fetch_token)
+                token_cache.store_token(self._client_id, self._token)
+        return self._token
+
+    async def _invalidate_token(self, token: str) -> None:
+        async with self._token_lock:
+            if self._token == token:
+                token_cache.clear_token(self._client_id)
+                self._token = None
+
+    def _fetch_token(self) -> str:
+        """Obtain a fresh access token through the SDK's ``Configuration``.
+
+        ``Configuration.access_token`` requests the token on first access. The configuration
+        is built directly rather than through :class:`BarcodeReader`, whose SDK loader looks
+        for request models that the pinned 25.10 release does not ship.
+        """
+        from aspose_barcode_cloud import Configuration
+
+        configuration = Configuration(
+            client_id=self._client_id, client_secret=self._client_secret, host=self._base_url
+        )
+        token = configuration.access_token
+        if not token:
+            raise RuntimeError("The installed Aspose SDK did not provide an access token")
+        return token
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBarcodeReader":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
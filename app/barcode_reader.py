@@ -1,49 +1,476 @@
 """High level helpers around the Aspose Barcode Cloud SDK."""
 from __future__ import annotations
 
-import base64
+import atexit
+import functools
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import mmap
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable, List, Optional
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Iterable, List, Optional
-import base64
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+try:  # pragma: no cover - optional SIMD accelerated codec
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover
+    from base64 import b64encode as _b64encode
+
+from app import token_cache
+
+if TYPE_CHECKING:  # pragma: no cover
+    from aspose_barcode_cloud import ApiClient, ApiConfiguration  # type: ignore
+
+
+class _Sdk(NamedTuple):
+    """The Aspose SDK entry points used by the reader, resolved for the installed version."""
+
+    ApiClient: type
+    ApiConfiguration: type
+    BarcodeApi: Optional[type]
+    ScanBase64Options: Optional[type]
+    ScanBase64Request: Optional[type]
+    PostBarcodeRecognizeFromUrlOrContentRequest: Optional[type]
+    is_new_sdk: bool
+    # 25.x releases split recognition into ScanApi (auto-detect) and RecognizeApi (explicit
+    # symbologies and recognition mode), both taking base64 request bodies.
+    ScanApi: Optional[type] = None
+    RecognizeApi: Optional[type] = None
+    RecognizeBase64Request: Optional[type] = None
+    # Names of the credential fields of the legacy configuration object, and a setter
+    # specialised for them. They are fixed for a given SDK version, so they are resolved
+    # once instead of per reader.
+    cid_attr: Optional[str] = None
+    csec_attr: Optional[str] = None
+    apply_credentials: Optional[Callable[[object, str, str, Optional[str]], None]] = None
+
 
-try:  # pragma: no cover - import resolution depends on SDK version
-    from aspose_barcode_cloud import (  # type: ignore
+def _probe_attr(obj: object, *names: str) -> Optional[str]:
+    """Return the first of ``names`` that ``obj`` exposes, or ``None``."""
+    return next((name for name in names if hasattr(obj, name)), None)
+
+
+def _compile_credential_setter(
+    cid_attr: str, csec_attr: str, base_url_attr: Optional[str]
+) -> Callable[[object, str, str, Optional[str]], None]:
+    """Generate a straight-line setter for the detected legacy configuration fields.
+
+    The attribute names only ever come from the fixed candidates probed in
+    :func:`_load_sdk`, so they are safe to splice into the generated source.
+    """
+    lines = [
+        "def apply_credentials(configuration, client_id, client_secret, base_url):",
+        f"    configuration.{cid_attr} = client_id",
+        f"    configuration.{csec_attr} = client_secret",
+    ]
+    if base_url_attr is not None:
+        lines += ["    if base_url:", f"        configuration.{base_url_attr} = base_url"]
+    namespace: Dict[str, object] = {}
+    exec("\n".join(lines), namespace)  # noqa: S102 - trusted, generated source
+    return namespace["apply_credentials"]  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_sdk() -> _Sdk:
+    """Import the Aspose SDK on first use.
+
+    The SDK pulls in urllib3 and the TLS stack, so importing it lazily keeps ``--help`` and
+    argument or credential errors fast.
+    """
+    try:  # pragma: no cover - import resolution depends on SDK version
+        from aspose_barcode_cloud import (  # type: ignore
+            ApiClient,
+            Configuration,
+            RecognizeApi,
+            RecognizeBase64Request,
+            ScanApi,
+            ScanBase64Request,
+        )
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        return _Sdk(
+            ApiClient,
+            Configuration,
+            None,
+            None,
+            ScanBase64Request,
+            None,
+            is_new_sdk=True,
+            ScanApi=ScanApi,
+            RecognizeApi=RecognizeApi,
+            RecognizeBase64Request=RecognizeBase64Request,
+        )
+
+    try:  # pragma: no cover
+        from aspose_barcode_cloud import (  # type: ignore
+            ApiClient,
+            ApiConfiguration,
+            BarcodeApi,
+            ScanBase64Options,
+            ScanBase64Request,
+        )
+    except ImportError:  # pragma: no cover
+        try:
+            from aspose_barcode_cloud import (  # type: ignore
+                ApiClient,
+                BarcodeApi,
+                Configuration as ApiConfiguration,
+                PostBarcodeRecognizeFromUrlOrContentRequest,
+            )
+        except ImportError as exc:
+            raise ImportError(
+                "Unsupported aspose-barcode-cloud SDK: install the version pinned in "
+                f"requirements.txt (pip install -r requirements.txt). Details: {exc}"
+            ) from exc
+
+        probe_configuration = ApiConfiguration()
+        cid_attr = _probe_attr(probe_configuration, "client_id", "app_sid")
+        csec_attr = _probe_attr(probe_configuration, "client_secret", "app_key")
+        base_url_attr = _probe_attr(probe_configuration, "api_base_url", "base_url")
+        apply_credentials = None
+        if cid_attr is not None and csec_attr is not None:
+            apply_credentials = _compile_credential_setter(cid_attr, csec_attr, base_url_attr)
+        return _Sdk(
+            ApiClient,
+            ApiConfiguration,
+            BarcodeApi,
+            None,
+            None,
+            PostBarcodeRecognizeFromUrlOrContentRequest,
+            is_new_sdk=False,
+            cid_attr=cid_attr,
+            csec_attr=csec_attr,
+            apply_credentials=apply_credentials,
+        )
+
+    return _Sdk(
         ApiClient,
         ApiConfiguration,
         BarcodeApi,
         ScanBase64Options,
         ScanBase64Request,
+        None,
+        is_new_sdk=True,
     )
 
-    _NEW_SDK = True
-except ImportError:  # pragma: no cover
-    from aspose_barcode_cloud import (  # type: ignore
-        ApiClient,
-        BarcodeApi,
-        Configuration as ApiConfiguration,
-        PostBarcodeRecognizeFromUrlOrContentRequest,
-    )
 
-    _NEW_SDK = False
+logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# HTTP statuses worth retrying: throttling and transient gateway/server failures.
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+_TRANSIENT_MARKERS = ("rate limit", "quota")
+
+# Number of keep-alive connections kept per host by the SDK's urllib3 pool.
+_POOL_MAXSIZE = 10
+
+# API clients shared by every reader in the process, keyed by (client id, secret, base url),
+# so repeated scans reuse pooled keep-alive connections instead of new TCP/TLS handshakes.
+_CLIENT_CACHE: Dict[Tuple[str, str, Optional[str]], "ApiClient"] = {}
+_SHARED_READERS: Dict[Tuple[str, str, Optional[str]], "BarcodeReader"] = {}
+_CACHE_LOCK = threading.Lock()
+# Serialises invalidation and persistence of the access token of the shared configurations.
+_TOKEN_LOCK = threading.Lock()
+
+# On-disk cache of recognition results keyed by image content digest and scan options. It lives
+# in the user's home rather than the shared temporary directory, where other local users could
+# plant entries under predictable names.
+_RESULT_CACHE_DIR = Path.home() / ".cache" / "aspose_barcode" / "results"
+
+# Files smaller than this are read into memory; mapping them costs more than it saves.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Slice size for base64 encoding; a multiple of 3 so that every slice but the last encodes
+# without padding and the pieces can simply be concatenated.
+_B64_CHUNK_SIZE = 57 * 1024
+
+# Recognition modes of the REST API and the 25.x SDK, keyed by the lower-cased names that
+# ``--preset`` may carry, including the quality presets of the older SDK releases.
+_RECOGNITION_MODES = {
+    "fast": "Fast",
+    "normal": "Normal",
+    "excellent": "Excellent",
+    "highperformance": "Fast",
+    "normalquality": "Normal",
+    "highquality": "Excellent",
+}
+# Recognition with a mode requires a symbology list, so one is sent when only a preset is given.
+_DEFAULT_BARCODE_TYPES = ["MostCommonlyUsed"]
+
+
+def _recognition_mode(preset: Optional[str]) -> Optional[str]:
+    """Return the ``recognitionMode`` value for ``preset``; raise ``ValueError`` if unknown."""
+    if not preset:
+        return None
+    try:
+        return _RECOGNITION_MODES[preset.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported recognition preset {preset!r}; expected Fast, Normal or Excellent"
+        ) from None
+
+
+@contextmanager
+def _open_image(path: Path) -> Iterator[bytes | memoryview]:
+    """Yield the content of ``path`` as a read-only buffer.
+
+    Large files are memory-mapped instead of copied into a ``bytes`` object, so hashing and
+    encoding read straight from the page cache. The buffer is only valid inside the block.
+    """
+    try:
+        stream = path.open("rb")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Image not found: {path}") from exc
+    with stream:
+        size = os.fstat(stream.fileno()).st_size
+        if size < _MMAP_THRESHOLD:
+            yield stream.read()
+            return
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            mapped.close()
+
+
+def _ensure_readable(paths: Iterable[Path | str]) -> None:
+    """Fail before any request is sent if one of ``paths`` cannot be opened."""
+    for path in paths:
+        try:
+            with Path(path).open("rb"):
+                pass
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"Image not found: {path}") from exc
+
+
+def _encode_image_b64(data: bytes | memoryview) -> bytearray:
+    """Return the base64 representation of ``data`` as ASCII bytes.
+
+    The input is encoded slice by slice into a single preallocated output buffer, so no
+    full-size intermediate encoded ``bytes`` object is created. Callers decode the result
+    only if the consumer needs text.
+    """
+    with memoryview(data) as view:
+        encoded = bytearray(-(-len(view) // 3) * 4)
+        offset = 0
+        for start in range(0, len(view), _B64_CHUNK_SIZE):
+            piece = _b64encode(view[start : start + _B64_CHUNK_SIZE])
+            encoded[offset : offset + len(piece)] = piece
+            offset += len(piece)
+    return encoded
+
+
+def _result_cache_key(
+    data: bytes | memoryview,
+    barcode_types: Optional[List[str]],
+    preset: Optional[str],
+    base_url: Optional[str],
+    backend: str,
+) -> str:
+    # ``backend`` tells the SDK and the REST reader apart: their options and responses differ.
+    image_digest = hashlib.blake2b(data, digest_size=16)
+    options = json.dumps([sorted(barcode_types or ()), preset, base_url, backend])
+    options = options.encode("utf-8")
+    options_digest = hashlib.blake2b(options, digest_size=8)
+    return f"{image_digest.hexdigest()}-{options_digest.hexdigest()}"
+
+
+def _load_cached_results(key: str) -> Optional[List["RecognizedBarcode"]]:
+    try:
+        with (_RESULT_CACHE_DIR / f"{key}.json").open(encoding="utf-8") as stream:
+            return [RecognizedBarcode(**item) for item in json.load(stream)]
+    except FileNotFoundError:
+        return None
+    except (OSError, TypeError, ValueError) as exc:
+        logger.debug("Ignoring unreadable result cache entry %s: %s", key, exc)
+        return None
+
+
+def _store_cached_results(key: str, results: List["RecognizedBarcode"]) -> None:
+    target = _RESULT_CACHE_DIR / f"{key}.json"
+    temporary = target.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _RESULT_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temporary.write_text(json.dumps([item._asdict() for item in results]), encoding="utf-8")
+        os.replace(temporary, target)
+    except OSError as exc:
+        logger.warning("Could not write result cache entry %s: %s", target, exc)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if getattr(exc, "status", None) in _TRANSIENT_STATUSES:
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+def _retry_transient(
+    max_attempts: int = 3, base: float = 0.5, cap: float = 8.0
+) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Retry the decorated call on throttling and transient server errors.
+
+    Waits ``min(cap, base * 2**attempt)`` seconds plus a small random jitter between
+    attempts and re-raises the last error once ``max_attempts`` is exhausted.
+    """
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> _T:
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as exc:
+                    if attempt + 1 >= max_attempts or not _is_transient(exc):
+                        raise
+                    delay = min(cap, base * 2**attempt) + random.uniform(0, 0.25)
+                    logger.warning(
+                        "Transient API error (%s); retrying in %.2fs (attempt %d of %d)",
+                        getattr(exc, "status", None) or exc,
+                        delay,
+                        attempt + 2,
+                        max_attempts,
+                    )
+                    time.sleep(delay)
+            raise AssertionError("unreachable")  # pragma: no cover
+
+        return wrapper
+
+    return decorator
+
+
+def _tune_connection_pool(api_client: ApiClient) -> None:
+    """Raise the per-host keep-alive pool size of the SDK's urllib3 pool manager."""
+    rest_client = getattr(api_client, "rest_client", None)
+    pool_manager = getattr(rest_client, "pool_manager", None)
+    if pool_manager is None:  # pragma: no cover - depends on SDK version
+        return
+    pool_manager.connection_pool_kw["maxsize"] = _POOL_MAXSIZE
+    pool_manager.connection_pool_kw["block"] = False
+
+
+def _peek_token(configuration: object) -> Optional[str]:
+    """Return the access token already held by ``configuration`` without fetching one.
+
+    The SDK exposes the token through a property that requests a new one when it is unset,
+    so the instance attributes are inspected directly.
+    """
+    attributes = getattr(configuration, "__dict__", {})
+    return attributes.get("_access_token") or attributes.get("access_token") or None
 
-logger = logging.getLogger(__name__)
 
+def _set_token(configuration: object, token: Optional[str]) -> None:
+    if "_access_token" in getattr(configuration, "__dict__", {}):
+        configuration._access_token = token  # type: ignore[attr-defined]
+    else:
+        configuration.access_token = token  # type: ignore[attr-defined]
 
-@dataclass
-class RecognizedBarcode:
-    """A simple representation of the recognition result."""
+
+def _get_api_client(client_id: str, client_secret: str, base_url: Optional[str]) -> ApiClient:
+    key = (client_id, client_secret, base_url)
+    with _CACHE_LOCK:
+        api_client = _CLIENT_CACHE.get(key)
+        if api_client is None:
+            logger.debug("Creating shared API client for base URL: %s", base_url or "default")
+            configuration = BarcodeReader._build_configuration(client_id, client_secret, base_url)
+            if hasattr(configuration, "connection_pool_maxsize"):
+                configuration.connection_pool_maxsize = _POOL_MAXSIZE
+            cached_token = token_cache.load_token(client_id)
+            if cached_token:
+                logger.debug("Reusing cached access token")
+                _set_token(configuration, cached_token)
+            api_client = _load_sdk().ApiClient(configuration)
+            _tune_connection_pool(api_client)
+            _CLIENT_CACHE[key] = api_client
+        else:
+            logger.debug("Reusing shared API client for base URL: %s", base_url or "default")
+    return api_client
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """Close every pooled API client. Registered to run at interpreter exit."""
+    with _CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+        _SHARED_READERS.clear()
+    for api_client in clients:
+        close = getattr(api_client, "close", None)
+        if close is None:  # 25.x clients have no close(); release their connection pool
+            close = getattr(getattr(api_client, "rest_client", None), "close", None)
+        if close is not None:
+            close()
+
+
+class RecognizedBarcode(NamedTuple):
+    """A simple representation of the recognition result.
+
+    A named tuple rather than a dataclass: results are immutable and created in bulk, and a
+    tuple needs no per-instance ``__dict__``.
+    """
 
     value: str
     symbology: str
     confidence: Optional[float] = None
 
 
+def _to_recognized_barcodes(results: Iterable[object]) -> List[RecognizedBarcode]:
+    """Convert SDK barcode models of either SDK generation into :class:`RecognizedBarcode`."""
+    get = getattr  # local alias: avoids a global/builtin lookup per attribute access
+    return [
+        RecognizedBarcode(
+            value=get(item, "barcode_value", ""),
+            # Only fall back to the legacy field name when the new one is missing or empty.
+            symbology=get(item, "type", None) or get(item, "code_type_name", ""),
+            confidence=get(item, "confidence", None),
+        )
+        for item in results
+    ]
+
+
+class _RequestThrottle:
+    """Bounds the number of in-flight requests and spaces out their start times."""
+
+    def __init__(self, max_concurrency: int, min_interval: float) -> None:
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self) -> "_RequestThrottle":
+        self._slots.acquire()
+        if self._min_interval > 0:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self._min_interval
+            if start > now:
+                time.sleep(start - now)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._slots.release()
+
+
 class BarcodeReader:
     """Wraps the Aspose Barcode Cloud SDK to read codes from local images."""
 
@@ -55,44 +482,65 @@ class BarcodeReader:
         base_url: Optional[str] = None,
     ) -> None:
         logger.debug("Initialising BarcodeReader with base URL: %s", base_url or "default")
-        configuration = self._build_configuration(client_id, client_secret, base_url)
-        self._api_client = ApiClient(configuration)
-        self._barcode_api = BarcodeApi(self._api_client)
-        logger.info("BarcodeReader ready using %s SDK", "new" if _NEW_SDK else "legacy")
-        configuration = self._build_configuration(client_id, client_secret, base_url)
-        self._api_client = ApiClient(configuration)
-        self._barcode_api = BarcodeApi(self._api_client)
+        self._sdk = _load_sdk()
+        self._client_id = client_id
+        self._base_url = base_url
+        self._api_client = _get_api_client(client_id, client_secret, base_url)
+        self._configuration = getattr(self._api_client, "configuration", None)
+        # Token loaded from the on-disk cache, kept to recognise requests that were rejected
+        # because of it (several may be in flight when it turns out to be stale), and the
+        # token last seen on disk.
+        self._cached_token = _peek_token(self._configuration)
+        self._persisted_token = self._cached_token
+        if self._sdk.ScanApi is not None:
+            self._scan_api = self._sdk.ScanApi(self._api_client)
+            self._recognize_api = self._sdk.RecognizeApi(self._api_client)
+            generation = "25.x"
+        else:
+            self._barcode_api = self._sdk.BarcodeApi(self._api_client)
+            generation = "new" if self._sdk.is_new_sdk else "legacy"
+        logger.info("BarcodeReader ready using %s SDK", generation)
+
+    @classmethod
+    def shared(
+        cls,
+        client_id: str,
+        client_secret: str,
+        *,
+        base_url: Optional[str] = None,
+    ) -> "BarcodeReader":
+        """Return a process-wide reader for the given credentials, creating it on first use."""
+        key = (client_id, client_secret, base_url)
+        with _CACHE_LOCK:
+            reader = _SHARED_READERS.get(key)
+        if reader is None:
+            reader = cls(client_id, client_secret, base_url=base_url)
+            with _CACHE_LOCK:
+                reader = _SHARED_READERS.setdefault(key, reader)
+        return reader
 
     @staticmethod
     def _build_configuration(
         client_id: str, client_secret: str, base_url: Optional[str]
     ) -> ApiConfiguration:
-        if _NEW_SDK:
-            configuration = ApiConfiguration(client_id=client_id, client_secret=client_secret)
+        sdk = _load_sdk()
+        if sdk.ScanApi is not None:
+            return sdk.ApiConfiguration(
+                client_id=client_id, client_secret=client_secret, host=base_url
+            )
+        if sdk.is_new_sdk:
+            configuration = sdk.ApiConfiguration(client_id=client_id, client_secret=client_secret)
             if base_url:
                 configuration.api_base_url = base_url
             return configuration
 
-        configuration = ApiConfiguration()
-        if hasattr(configuration, "client_id"):
-            configuration.client_id = client_id
-        elif hasattr(configuration, "app_sid"):
-            configuration.app_sid = client_id
-        else:  # pragma: no cover - defensive
+        if sdk.cid_attr is None:  # pragma: no cover - defensive
             raise AttributeError("Unsupported SDK configuration: client id field not found")
-
-        if hasattr(configuration, "client_secret"):
-            configuration.client_secret = client_secret
-        elif hasattr(configuration, "app_key"):
-            configuration.app_key = client_secret
-        else:  # pragma: no cover - defensive
+        if sdk.csec_attr is None:  # pragma: no cover - defensive
             raise AttributeError("Unsupported SDK configuration: client secret field not found")
 
-        if base_url:
-            if hasattr(configuration, "api_base_url"):
-                configuration.api_base_url = base_url
-            elif hasattr(configuration, "base_url"):
-                configuration.base_url = base_url
+        configuration = sdk.ApiConfiguration()
+        sdk.apply_credentials(configuration, client_id, client_secret, base_url)
         return configuration
 
     def scan_image(
@@ -101,68 +549,160 @@ class BarcodeReader:
         *,
         barcode_types: Optional[Iterable[str]] = None,
         preset: Optional[str] = None,
+        use_cache: bool = True,
     ) -> List[RecognizedBarcode]:
         """Recognise barcodes from a local image.
 
         Args:
             image_path: Path to the image that contains barcodes.
             barcode_types: Optional iterable with the list of symbologies to search for.
-            preset: Optional Aspose preset name (e.g. ``HighPerformance``).
+            preset: Optional recognition preset. The 25.x SDK accepts ``Fast``, ``Normal`` or
+                ``Excellent`` (``HighPerformance`` and ``HighQuality`` map to ``Fast`` and
+                ``Excellent``); older SDKs receive the name unchanged.
+            use_cache: Reuse results of a previous scan of identical image content with the
+                same options instead of calling the API again.
         """
 
         path = Path(image_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Image not found: {path}")
         logger.info("Scanning image %s", path)
-        image_bytes = path.read_bytes()
+        filters = list(barcode_types) if barcode_types else None
 
-        if _NEW_SDK:
-            results = self._scan_with_new_sdk(image_bytes, barcode_types, preset)
-        else:
-            results = self._scan_with_legacy_sdk(image_bytes, barcode_types, preset)
+        with _open_image(path) as image:
+            cache_key = None
+            if use_cache:
+                cache_key = _result_cache_key(image, filters, preset, self._base_url, "sdk")
+                cached = _load_cached_results(cache_key)
+                if cached is not None:
+                    logger.info("Using cached result for image %s", path)
+                    return cached
+
+            if self._sdk.ScanApi is not None:
+                results = self._scan_with_scan_api(image, filters, preset)
+            elif self._sdk.is_new_sdk:
+                results = self._scan_with_new_sdk(image, filters, preset)
+            else:
+                # The legacy request model needs an actual ``bytes`` object.
+                results = self._scan_with_legacy_sdk(bytes(image), filters, preset)
 
         logger.debug("Scan produced %d result(s)", len(results))
+        if cache_key is not None:
+            _store_cached_results(cache_key, results)
         return results
 
-        image_bytes = path.read_bytes()
+    def scan_images(
+        self,
+        image_paths: Iterable[Path | str],
+        *,
+        barcode_types: Optional[Iterable[str]] = None,
+        preset: Optional[str] = None,
+        use_cache: bool = True,
+        max_concurrency: int = 8,
+        min_interval: float = 0.0,
+    ) -> List[List[RecognizedBarcode]]:
+        """Recognise barcodes from several local images over the shared API client.
 
-        if _NEW_SDK:
-            return self._scan_with_new_sdk(image_bytes, barcode_types, preset)
-        return self._scan_with_legacy_sdk(image_bytes, barcode_types, preset)
+        Requests are dispatched concurrently; results are returned in the order of
+        ``image_paths``.
+
+        Args:
+            image_paths: Paths to the images that contain barcodes.
+            barcode_types: Optional iterable with the list of symbologies to search for.
+            preset: Optional recognition preset. The 25.x SDK accepts ``Fast``, ``Normal`` or
+                ``Excellent`` (``HighPerformance`` and ``HighQuality`` map to ``Fast`` and
+                ``Excellent``); older SDKs receive the name unchanged.
+            use_cache: Reuse cached results for images that were scanned before.
+            max_concurrency: Maximum number of requests in flight at the same time.
+            min_interval: Minimum delay in seconds between the start of two requests.
+        """
+
+        paths = list(image_paths)
+        filters = list(barcode_types) if barcode_types is not None else None
+        if self._sdk.ScanApi is not None:
+            _recognition_mode(preset)  # reject an unknown preset before any request is sent
+        if len(paths) == 1:
+            return [
+                self.scan_image(paths[0], barcode_types=filters, preset=preset, use_cache=use_cache)
+            ]
+
+        # Every path is checked up front: a typo in the last argument should not surface only
+        # after the rest of the batch has already been paid for.
+        _ensure_readable(paths)
+        logger.info(
+            "Scanning %d image(s) with up to %d concurrent request(s)", len(paths), max_concurrency
+        )
+        throttle = _RequestThrottle(max_concurrency, min_interval)
+
+        def scan(path: Path | str) -> List[RecognizedBarcode]:
+            with throttle:
+                return self.scan_image(
+                    path, barcode_types=filters, preset=preset, use_cache=use_cache
+                )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [executor.submit(scan, path) for path in paths]
+            try:
+                return [future.result() for future in futures]
+            except BaseException:
+                # Do not start requests for the remaining images once the batch has failed.
+                for future in futures:
+                    future.cancel()
+                raise
 
     # ------------------------------------------------------------------
+    def _scan_with_scan_api(
+        self,
+        image: bytes | memoryview,
+        barcode_types: Optional[Iterable[str]],
+        preset: Optional[str],
+    ) -> List[RecognizedBarcode]:
+        filters = list(barcode_types or [])
+        mode = _recognition_mode(preset)
+        logger.debug(
+            "Executing 25.x SDK scan with %s barcode filter(s) and recognition mode %s",
+            filters if filters else "no",
+            mode or "default",
+        )
+        encoded = _encode_image_b64(image).decode("ascii")
+        if filters or mode:
+            request = self._sdk.RecognizeBase64Request(
+                barcode_types=filters or list(_DEFAULT_BARCODE_TYPES),
+                file_base64=encoded,
+                recognition_mode=mode,
+            )
+            response = self._send(self._send_recognize_request, request)
+        else:
+            request = self._sdk.ScanBase64Request(file_base64=encoded)
+            response = self._send(self._send_scan_request, request)
+        results = getattr(response, "barcodes", None) or []
+        logger.debug("Received %d result(s) from 25.x SDK response", len(results))
+        return _to_recognized_barcodes(results)
+
     def _scan_with_new_sdk(
         self,
-        image_bytes: bytes,
+        image: bytes | memoryview,
         barcode_types: Optional[Iterable[str]],
         preset: Optional[str],
     ) -> List[RecognizedBarcode]:
-        assert _NEW_SDK
+        assert self._sdk.is_new_sdk
         filters = list(barcode_types or [])
         logger.debug(
             "Executing new SDK scan with %s barcode filter(s) and preset %s",
             filters if filters else "no",
             preset or "default",
         )
-        options = ScanBase64Options(
-            image=base64.b64encode(image_bytes).decode("ascii"),
-            barcode_types=list(barcode_types or []),
+        encoded = _encode_image_b64(image)
+        options = self._sdk.ScanBase64Options(
+            image=encoded.decode("ascii"),
+            barcode_types=filters,
         )
         if preset:
             options.preset = preset
 
-        request = ScanBase64Request(scan_options=options)
-        response = self._barcode_api.scan_base64(request)
+        request = self._sdk.ScanBase64Request(scan_options=options)
+        response = self._send(self._send_new_request, request)
         results = getattr(response, "barcodes", None) or getattr(response, "barcode_list", [])
         logger.debug("Received %d result(s) from new SDK response", len(results))
-        return [
-            RecognizedBarcode(
-                value=getattr(item, "barcode_value", ""),
-                symbology=getattr(item, "type", getattr(item, "code_type_name", "")),
-                confidence=getattr(item, "confidence", None),
-            )
-            for item in results
-        ]
+        return _to_recognized_barcodes(results)
 
     def _scan_with_legacy_sdk(
         self,
@@ -170,11 +710,10 @@ class BarcodeReader:
         barcode_types: Optional[Iterable[str]],
         preset: Optional[str],
     ) -> List[RecognizedBarcode]:
-        assert not _NEW_SDK
-        filters = list(barcode_types or [])
+        assert not self._sdk.is_new_sdk
         logger.debug(
             "Executing legacy SDK scan with %s barcode filter(s) and preset %s",
-            filters if filters else "no",
+            barcode_types or "no",
             preset or "default",
         )
         types_param = None
@@ -185,22 +724,60 @@ class BarcodeReader:
         if preset:
             kwargs["preset"] = preset
 
-        request = PostBarcodeRecognizeFromUrlOrContentRequest(**kwargs)
-        response = self._barcode_api.post_barcode_recognize_from_url_or_content(request)
+        request = self._sdk.PostBarcodeRecognizeFromUrlOrContentRequest(**kwargs)
+        response = self._send(self._send_legacy_request, request)
         results = getattr(response, "barcodes", None) or getattr(response, "barcode_list", [])
         logger.debug("Received %d result(s) from legacy SDK response", len(results))
-        return [
-            RecognizedBarcode(
-                value=getattr(item, "barcode_value", ""),
-                symbology=getattr(item, "type", getattr(item, "code_type_name", "")),
-                confidence=getattr(item, "confidence", None),
-            )
-            for item in results
-        ]
+        return _to_recognized_barcodes(results)
+
+    def _send(self, send: Callable[[object], _T], request: object) -> _T:
+        """Send ``request``, keeping the on-disk access token cache in sync."""
+        token = _peek_token(self._configuration)
+        try:
+            response = send(request)
+        except Exception as exc:
+            if getattr(exc, "status", None) != 401 or not token or token != self._cached_token:
+                raise
+            with _TOKEN_LOCK:
+                # Only the first request rejected with the stale token drops it; the others
+                # find it already replaced and simply retry.
+                if _peek_token(self._configuration) == token:
+                    logger.info("Cached access token was rejected; requesting a new one")
+                    token_cache.clear_token(self._client_id)
+                    _set_token(self._configuration, None)
+            response = send(request)
+
+        token = _peek_token(self._configuration)
+        if token and token != self._persisted_token:
+            with _TOKEN_LOCK:
+                if token != self._persisted_token:
+                    token_cache.store_token(self._client_id, token)
+                    self._persisted_token = token
+        return response
+
+    @_retry_transient()
+    def _send_scan_request(self, request):
+        return self._scan_api.scan_base64(request)
+
+    @_retry_transient()
+    def _send_recognize_request(self, request):
+        return self._recognize_api.recognize_base64(request)
+
+    @_retry_transient()
+    def _send_new_request(self, request):
+        return self._barcode_api.scan_base64(request)
+
+    @_retry_transient()
+    def _send_legacy_request(self, request):
+        return self._barcode_api.post_barcode_recognize_from_url_or_content(request)
 
     def close(self) -> None:
-        logger.debug("Closing BarcodeReader API client")
-        self._api_client.close()
+        """Release the reader.
+
+        The underlying API client is pooled and shared with other readers, so it stays open
+        until :func:`close_shared_clients` runs (at the latest, at interpreter exit).
+        """
+        logger.debug("Releasing BarcodeReader; shared API client stays open")
 
     def __enter__(self) -> "BarcodeReader":
         return self
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import os
@@ -9,18 +10,31 @@ import sys
 from pathlib import Path
 from typing import Iterable, List
 
-from app.barcode_reader import BarcodeReader
+from app.barcode_reader import BarcodeReader, RecognizedBarcode, _recognition_mode
 from app.logging_utils import configure_logging
 
+try:  # pragma: no cover - optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    # Built once per process: parse_args() does not mutate the parser and returns a fresh
+    # namespace. Environment fallbacks are therefore resolved in main(), not as defaults here.
     parser = argparse.ArgumentParser(
         description="Read barcodes from a local image using Aspose Barcode Cloud."
     )
-    parser.add_argument("image", type=Path, help="Path to the image that contains barcodes")
+    parser.add_argument(
+        "image",
+        type=Path,
+        nargs="+",
+        help="One or more paths to images that contain barcodes",
+    )
     parser.add_argument(
         "--type",
         dest="barcode_types",
@@ -29,17 +43,20 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--preset",
-        help="Optional Aspose recognition preset (e.g. HighPerformance, HighQuality)",
+        help=(
+            "Optional recognition mode: Fast, Normal or Excellent (HighPerformance and "
+            "HighQuality are accepted as Fast and Excellent)."
+        ),
     )
     parser.add_argument("--base-url", help="Override the Aspose Cloud API base url", default=None)
     parser.add_argument(
         "--client-id",
-        default=os.getenv("ASPOSE_CLIENT_ID"),
+        default=None,
         help="Aspose Cloud client id. Falls back to the ASPOSE_CLIENT_ID environment variable.",
     )
     parser.add_argument(
         "--client-secret",
-        default=os.getenv("ASPOSE_CLIENT_SECRET"),
+        default=None,
         help=(
             "Aspose Cloud client secret. Falls back to the ASPOSE_CLIENT_SECRET environment "
             "variable."
@@ -54,6 +71,29 @@ def build_parser() -> argparse.ArgumentParser:
             "directory."
         ),
     )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Always call the API instead of reusing results cached for identical images.",
+    )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        default=None,
+        help=(
+            "Scan up to N images concurrently with the asynchronous HTTP client (requires the "
+            "optional httpx package; falls back to N worker threads without it)."
+        ),
+    )
+    parser.add_argument(
+        "--min-interval",
+        type=float,
+        metavar="SECONDS",
+        default=0.0,
+        help="Wait at least SECONDS between the start of two API requests (default: no delay).",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -72,24 +112,85 @@ def _ensure_credentials(client_id: str | None, client_secret: str | None) -> Non
 
 
 def _format_table(results: Iterable[dict]) -> str:
-    rows: List[str] = []
+    # Collect the pieces of every row in one flat list and join once at the end, instead of
+    # building a formatted string per row.
+    parts: List[str] = []
+    append = parts.append
     for item in results:
-        value = item.get("value", "")
-        symbology = item.get("symbology", "")
+        append(str(item.get("symbology", "")))
+        append(": ")
+        append(str(item.get("value", "")))
         confidence = item.get("confidence")
-        confidence_str = f" ({confidence:.2%})" if isinstance(confidence, (int, float)) else ""
-        rows.append(f"{symbology}: {value}{confidence_str}")
-    return "\n".join(rows) if rows else "No barcodes found."
+        if isinstance(confidence, (int, float)):
+            append(" (")
+            append(format(confidence, ".2%"))
+            append(")")
+        append("\n")
+    return "".join(parts) or "No barcodes found.\n"
+
+
+def _format_batch_table(images: Iterable[Path], payloads: Iterable[List[dict]]) -> str:
+    return "\n".join(
+        f"{image}:\n{_format_table(payload)}" for image, payload in zip(images, payloads)
+    )
+
+
+def _write_json(payload: object) -> None:
+    # Serialise the whole document up front and hand the UTF-8 bytes to the binary stream,
+    # instead of letting json.dump push many small chunks through the text layer.
+    stream = getattr(sys.stdout, "buffer", None)
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8") + b"\n"
+    if stream is None:  # stdout replaced by a text-only stream
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    stream.write(data)
+    stream.flush()
+
+
+async def _scan_parallel(args: argparse.Namespace) -> List[List[RecognizedBarcode]]:
+    from app.async_barcode_reader import AsyncBarcodeReader
+
+    async with AsyncBarcodeReader(
+        args.client_id,
+        args.client_secret,
+        base_url=args.base_url,
+        max_concurrency=args.parallel,
+        min_interval=args.min_interval,
+    ) as reader:
+        return await reader.scan_images_async(
+            args.image,
+            barcode_types=args.barcode_types,
+            preset=args.preset,
+            use_cache=args.use_cache,
+        )
+
+
+def _async_client_available() -> bool:
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
 
 def main(argv: List[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
+    if args.client_id is None:
+        args.client_id = os.getenv("ASPOSE_CLIENT_ID")
+    if args.client_secret is None:
+        args.client_secret = os.getenv("ASPOSE_CLIENT_SECRET")
 
     log_path = configure_logging(args.log_file)
     logger.info("Log file initialised at %s", log_path)
-    logger.info("Starting barcode recognition for image %s", args.image)
-    if args.barcode_types:
+    logger.info(
+        "Starting barcode recognition for image(s) %s", ", ".join(map(str, args.image))
+    )
+    if args.barcode_types and logger.isEnabledFor(logging.DEBUG):
         logger.debug("Barcode type filters: %s", ", ".join(args.barcode_types))
     if args.preset:
         logger.debug("Recognition preset: %s", args.preset)
@@ -98,42 +199,75 @@ def main(argv: List[str] | None = None) -> int:
 
     _ensure_credentials(args.client_id, args.client_secret)
 
-    with BarcodeReader(
-        client_id=args.client_id,
-        client_secret=args.client_secret,
-        base_url=args.base_url,
-    ) as reader:
-        results = reader.scan_image(
+    if args.parallel is not None and args.parallel < 1:
+        parser.error("--parallel must be a positive integer")
+    if args.min_interval < 0:
+        parser.error("--min-interval must not be negative")
+    try:
+        _recognition_mode(args.preset)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.parallel and _async_client_available():
+        logger.debug(
+            "Using the asynchronous HTTP client with %d concurrent request(s)", args.parallel
+        )
+        import asyncio
+
+        results_per_image = asyncio.run(_scan_parallel(args))
+    else:
+        if args.parallel:
+            logger.warning(
+                "httpx is not installed; scanning with %d worker thread(s)", args.parallel
+            )
+        reader = BarcodeReader.shared(
+            client_id=args.client_id,
+            client_secret=args.client_secret,
+            base_url=args.base_url,
+        )
+        results_per_image = reader.scan_images(
             args.image,
             barcode_types=args.barcode_types,
             preset=args.preset,
+            use_cache=args.use_cache,
+            max_concurrency=args.parallel or 8,
+            min_interval=args.min_interval,
         )
 
-    logger.info("Recognition finished. %d barcode(s) found.", len(results))
+    logger.info(
+        "Recognition finished. %d barcode(s) found in %d image(s).",
+        sum(len(results) for results in results_per_image),
+        len(results_per_image),
+    )
 
-    payload = [
-        {
-            "value": item.value,
-            "symbology": item.symbology,
-            "confidence": item.confidence,
-        }
-        for item in results
+    payloads = [
+        [
+            {
+                "value": item.value,
+                "symbology": item.symbology,
+                "confidence": item.confidence,
+            }
+            for item in results
+        ]
+        for results in results_per_image
     ]
+    if len(args.image) == 1:
+        payload = payloads[0]
+    else:
+        payload = [
+            {"image": str(image), "barcodes": barcodes}
+            for image, barcodes in zip(args.image, payloads)
+        ]
 
     if args.json:
         logger.debug("Writing JSON payload to stdout")
-        json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
-        sys.stdout.write("\n")
-        return 0
-
-    logger.debug("Writing table output to stdout")
-    sys.stdout.write(_format_table(payload) + "\n")
+        _write_json(payload)
     else:
         logger.debug("Writing table output to stdout")
-        json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
-        sys.stdout.write("\n")
-    else:
-        sys.stdout.write(_format_table(payload) + "\n")
+        if len(args.image) == 1:
+            sys.stdout.write(_format_table(payload))
+        else:
+            sys.stdout.write(_format_batch_table(args.image, payloads))
 
     return 0
 
@@ -2,23 +2,93 @@
 from __future__ import annotations
 
 import logging
+import logging.handlers
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 _DEFAULT_LOG_FILENAME = "barcode_reader.log"
+_LOG_MAX_BYTES = 5_000_000
+_LOG_BACKUP_COUNT = 3
+_LOG_BUFFER_SIZE = 64 * 1024
 
 
-def configure_logging(log_path: Optional[Path] = None, *, level: int = logging.DEBUG) -> Path:
-    """Configure logging for the application and return the log file path."""
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that batches records in a userspace buffer.
+
+    The stock handler flushes after every record and checks the file size (a ``stat``, a
+    ``seek`` and a ``tell``) on every emit. Here the log is opened lazily, its size is read
+    once when it is opened and then tracked by counting the bytes written, and it is only
+    flushed when the buffer fills up, when a WARNING or higher is logged, or when the handler
+    is closed.
+    """
+
+    _bytes_written = 0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + self.terminator
+            size = len(message) if message.isascii() else len(message.encode("utf-8", "replace"))
+            if self.stream is None:
+                self._bytes_written = _file_size(self.baseFilename)
+            if self.maxBytes > 0 and self._bytes_written and (
+                self._bytes_written + size > self.maxBytes
+            ):
+                self.doRollover()
+                self._bytes_written = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(message)
+            self._bytes_written += size
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:  # pragma: no cover - mirrors logging.StreamHandler
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def configure_logging(log_path: Optional[Path] = None, *, level: Optional[int] = None) -> Path:
+    """Configure logging for the application and return the log file path.
+
+    The file log level defaults to INFO, or DEBUG when the ``ASPOSE_DEBUG`` environment
+    variable is set to ``1``.
+    """
     if log_path is None:
+        # The working directory already exists, so there is nothing to create.
         log_path = Path.cwd() / _DEFAULT_LOG_FILENAME
     else:
         log_path = Path(log_path)
+        if log_path.parent != Path():
+            log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if level is None:
+        level = logging.DEBUG if os.getenv("ASPOSE_DEBUG") == "1" else logging.INFO
 
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    file_handler = _BufferedRotatingFileHandler(
+        log_path,
+        maxBytes=_LOG_MAX_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setLevel(level)
     stream_handler = logging.StreamHandler(sys.stderr)
     stream_handler.setLevel(logging.INFO)
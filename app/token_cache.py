@@ -0,0 +1,75 @@
+"""Persistence of Aspose Cloud OAuth access tokens between CLI runs."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+_TOKEN_CACHE_DIR = Path.home() / ".cache" / "aspose_barcode"
+
+# Aspose Cloud tokens are valid for an hour. The SDK does not report when a token was
+# issued, so a stored token is only trusted for a shorter, conservative period.
+_TOKEN_TTL = 50 * 60
+
+logger = logging.getLogger(__name__)
+
+
+def _token_path(client_id: str) -> Path:
+    # One file per client id, so runs with different credentials do not evict each other.
+    digest = hashlib.blake2b(client_id.encode("utf-8"), digest_size=8).hexdigest()
+    return _TOKEN_CACHE_DIR / f"token-{digest}.json"
+
+
+def load_token(client_id: str) -> Optional[str]:
+    """Return the stored access token for ``client_id`` if it has not expired yet."""
+    path = _token_path(client_id)
+    try:
+        with path.open(encoding="utf-8") as stream:
+            data = json.load(stream)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.debug("Ignoring unreadable token cache %s: %s", path, exc)
+        return None
+
+    if not isinstance(data, dict) or data.get("client_id") != client_id:
+        return None
+    if not isinstance(data.get("expires_at"), (int, float)) or data["expires_at"] <= time.time():
+        return None
+    token = data.get("token")
+    return token if isinstance(token, str) and token else None
+
+
+def store_token(client_id: str, token: str) -> None:
+    """Persist ``token`` for ``client_id`` in a file readable only by the current user."""
+    payload = json.dumps(
+        {"client_id": client_id, "token": token, "expires_at": time.time() + _TOKEN_TTL}
+    )
+    path = _token_path(client_id)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        _TOKEN_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf-8") as stream:
+            stream.write(payload)
+        os.replace(temporary, path)
+    except OSError as exc:
+        logger.warning("Could not write token cache %s: %s", path, exc)
+    else:
+        logger.debug("Access token cached at %s", path)
+
+
+def clear_token(client_id: str) -> None:
+    """Remove the stored access token of ``client_id``, e.g. after the API rejected it."""
+    path = _token_path(client_id)
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.warning("Could not remove token cache %s: %s", path, exc)
@@ -0,0 +1,162 @@
+"""Tests for the httpx-based reader, run against ``httpx.MockTransport``."""
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import os
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app import async_barcode_reader, token_cache  # noqa: E402
+from app.async_barcode_reader import AsyncBarcodeReader  # noqa: E402
+from app.barcode_reader import RecognizedBarcode  # noqa: E402
+
+_BARCODES = {"barcodes": [{"barcodeValue": "4607001234567", "type": "EAN13"}]}
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr("app.barcode_reader._RESULT_CACHE_DIR", tmp_path / "results")
+    monkeypatch.setattr(token_cache, "_TOKEN_CACHE_DIR", tmp_path / "tokens")
+    monkeypatch.setattr(async_barcode_reader, "_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(AsyncBarcodeReader, "_fetch_token", lambda self: "fresh")
+
+
+async def _reader(handler) -> AsyncBarcodeReader:
+    reader = AsyncBarcodeReader("id", "secret", base_url="https://api.test/v4.0")
+    await reader.aclose()
+    reader._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return reader
+
+
+def _scan(handler, paths, **options):
+    async def run():
+        async with await _reader(handler) as reader:
+            return await reader.scan_images_async(paths, use_cache=False, **options)
+
+    return asyncio.run(run())
+
+
+def _images(tmp_path, count: int):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"label-{index}.png"
+        path.write_bytes(os.urandom(100 + index))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize(
+    "options, endpoint, fields",
+    [
+        ({}, "/v4.0/barcode/scan-body", {}),
+        (
+            {"barcode_types": ["QR", "EAN13"], "preset": "fast"},
+            "/v4.0/barcode/recognize-body",
+            {"barcodeTypes": ["QR", "EAN13"], "recognitionMode": "Fast"},
+        ),
+        (
+            {"preset": "HighQuality"},
+            "/v4.0/barcode/recognize-body",
+            {"barcodeTypes": ["MostCommonlyUsed"], "recognitionMode": "Excellent"},
+        ),
+    ],
+)
+def test_request_body_is_valid_json(tmp_path, options, endpoint, fields):
+    (path,) = _images(tmp_path, 1)
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=_BARCODES)
+
+    results = _scan(handler, [path], **options)
+
+    assert results == [[RecognizedBarcode("4607001234567", "EAN13", None)]]
+    (request,) = requests
+    assert request.url.path == endpoint
+    assert request.headers["Authorization"] == "Bearer fresh"
+    expected = dict(fields, fileBase64=base64.b64encode(path.read_bytes()).decode("ascii"))
+    assert json.loads(request.content) == expected
+
+
+def test_stale_cached_token_is_replaced_once(tmp_path):
+    token_cache.store_token("id", "stale")
+    authorizations = []
+    all_stale_in_flight = asyncio.Event()
+
+    async def handler(request):
+        authorizations.append(request.headers["Authorization"])
+        if request.headers["Authorization"] == "Bearer stale":
+            # Answer only once every scan has been sent with the stale token.
+            if authorizations.count("Bearer stale") == 3:
+                all_stale_in_flight.set()
+            await asyncio.wait_for(all_stale_in_flight.wait(), timeout=5)
+            return httpx.Response(401)
+        return httpx.Response(200, json=_BARCODES)
+
+    results = _scan(handler, _images(tmp_path, 3))
+
+    assert len(results) == 3 and all(results)
+    assert authorizations.count("Bearer stale") == 3
+    assert authorizations.count("Bearer fresh") == 3
+    assert token_cache.load_token("id") == "fresh"
+
+
+def test_rejected_fresh_token_is_not_retried(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(401)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _scan(handler, _images(tmp_path, 1))
+    assert len(calls) == 1
+
+
+def test_transient_error_is_retried(tmp_path):
+    statuses = iter([503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json=_BARCODES if status == 200 else {})
+
+    assert _scan(handler, _images(tmp_path, 1)) == [
+        [RecognizedBarcode("4607001234567", "EAN13", None)]
+    ]
+
+
+def test_missing_image_fails_the_batch_before_any_request(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json=_BARCODES)
+
+    with pytest.raises(FileNotFoundError, match="missing.png"):
+        _scan(handler, _images(tmp_path, 3) + [tmp_path / "missing.png"])
+    assert calls == []
+
+
+def test_first_failure_cancels_the_remaining_scans(tmp_path):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(400)
+        await asyncio.sleep(30)
+        return httpx.Response(200, json=_BARCODES)
+
+    async def run():
+        async with await _reader(handler) as reader:
+            with pytest.raises(httpx.HTTPStatusError):
+                await reader.scan_images_async(_images(tmp_path, 4), use_cache=False)
+            # Nothing may still be using the client when the context manager closes it.
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    assert asyncio.run(run()) == []
@@ -0,0 +1,179 @@
+"""Tests for the SDK-backed barcode reader, run against a stub of the 25.x SDK."""
+from __future__ import annotations
+
+import base64
+import os
+import threading
+
+import pytest
+
+from app import barcode_reader, token_cache
+from app.barcode_reader import BarcodeReader, RecognizedBarcode
+
+
+class _ApiException(Exception):
+    def __init__(self, status: int) -> None:
+        super().__init__(status)
+        self.status = status
+
+
+class _Model:
+    def __init__(self, **fields) -> None:
+        self.__dict__.update(fields)
+
+
+class _Configuration:
+    def __init__(self, client_id=None, client_secret=None, host=None) -> None:
+        self.host = host
+        self._access_token = None
+
+
+class _ApiClient:
+    def __init__(self, configuration) -> None:
+        self.configuration = configuration
+
+
+class _StubApi:
+    """Answers with one barcode per request and hands out a fresh token when none is set."""
+
+    def __init__(self, api_client) -> None:
+        self.configuration = api_client.configuration
+
+    def scan_base64(self, request):
+        return self._answer(request)
+
+    def recognize_base64(self, request):
+        return self._answer(request)
+
+    def _answer(self, request):
+        hooks = _StubApi.hooks
+        token = self.configuration._access_token
+        hooks["tokens"].append(token)
+        hooks["requests"].append(request)
+        hooks["before_response"](token)
+        if token is None:
+            with hooks["lock"]:
+                if self.configuration._access_token is None:
+                    self.configuration._access_token = "fresh"
+        return _Model(barcodes=[_Model(barcode_value="4607001234567", type="EAN13")])
+
+
+@pytest.fixture
+def stub_api(monkeypatch, tmp_path):
+    hooks = {
+        "tokens": [],
+        "requests": [],
+        "lock": threading.Lock(),
+        "before_response": lambda token: None,
+    }
+    monkeypatch.setattr(_StubApi, "hooks", hooks, raising=False)
+    sdk = barcode_reader._Sdk(
+        _ApiClient,
+        _Configuration,
+        None,
+        None,
+        _Model,
+        None,
+        is_new_sdk=True,
+        ScanApi=_StubApi,
+        RecognizeApi=_StubApi,
+        RecognizeBase64Request=_Model,
+    )
+    monkeypatch.setattr(barcode_reader, "_load_sdk", lambda: sdk)
+    monkeypatch.setattr(barcode_reader, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(barcode_reader, "_SHARED_READERS", {})
+    monkeypatch.setattr(barcode_reader, "_RESULT_CACHE_DIR", tmp_path / "results")
+    monkeypatch.setattr(token_cache, "_TOKEN_CACHE_DIR", tmp_path / "tokens")
+    return hooks
+
+
+def _images(tmp_path, count: int):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"label-{index}.png"
+        path.write_bytes(os.urandom(100 + index))
+        paths.append(path)
+    return paths
+
+
+def test_stale_cached_token_is_replaced_once_for_a_whole_batch(stub_api, tmp_path, monkeypatch):
+    token_cache.store_token("id", "stale")
+    clears = []
+    monkeypatch.setattr(token_cache, "clear_token", clears.append)
+    # Hold every request sent with the stale token until all of them are in flight.
+    in_flight = threading.Barrier(4, timeout=5)
+
+    def reject_stale(token):
+        if token == "stale":
+            in_flight.wait()
+            raise _ApiException(401)
+
+    stub_api["before_response"] = reject_stale
+
+    reader = BarcodeReader("id", "secret")
+    results = reader.scan_images(_images(tmp_path, 4), use_cache=False, max_concurrency=4)
+
+    assert results == [[RecognizedBarcode("4607001234567", "EAN13", None)]] * 4
+    assert stub_api["tokens"].count("stale") == 4
+    assert clears == ["id"]
+    assert token_cache.load_token("id") == "fresh"
+
+
+def test_rejected_fresh_token_is_not_retried(stub_api, tmp_path):
+    def reject(token):
+        raise _ApiException(401)
+
+    stub_api["before_response"] = reject
+
+    reader = BarcodeReader("id", "secret")
+    with pytest.raises(_ApiException):
+        reader.scan_image(_images(tmp_path, 1)[0], use_cache=False)
+    assert len(stub_api["requests"]) == 1
+
+
+def test_preset_without_types_uses_the_default_symbology_list(stub_api, tmp_path):
+    reader = BarcodeReader("id", "secret")
+    reader.scan_image(_images(tmp_path, 1)[0], preset="HighQuality", use_cache=False)
+
+    (request,) = stub_api["requests"]
+    assert request.barcode_types == ["MostCommonlyUsed"]
+    assert request.recognition_mode == "Excellent"
+
+
+def test_unknown_preset_is_rejected_before_any_request(stub_api, tmp_path):
+    reader = BarcodeReader("id", "secret")
+    with pytest.raises(ValueError, match="Unsupported recognition preset"):
+        reader.scan_images(_images(tmp_path, 2), preset="MaxBarCodes", use_cache=False)
+    assert stub_api["requests"] == []
+
+
+def test_missing_image_fails_the_batch_before_any_request(stub_api, tmp_path):
+    paths = _images(tmp_path, 3) + [tmp_path / "missing.png"]
+
+    reader = BarcodeReader("id", "secret")
+    with pytest.raises(FileNotFoundError, match="missing.png"):
+        reader.scan_images(paths, use_cache=False)
+    assert stub_api["requests"] == []
+
+
+@pytest.mark.parametrize(
+    "size",
+    [0, 1, 2, 3, 57 * 1024 - 1, 57 * 1024, 57 * 1024 + 1, 2 * 57 * 1024 + 2],
+)
+def test_chunked_base64_matches_the_standard_encoder(size):
+    data = os.urandom(size)
+    assert bytes(barcode_reader._encode_image_b64(data)) == base64.b64encode(data)
+
+
+@pytest.mark.parametrize(
+    "size, mapped",
+    [(64 * 1024 - 1, False), (64 * 1024, True), (64 * 1024 + 1, True)],
+)
+def test_images_are_memory_mapped_from_the_threshold_on(tmp_path, size, mapped):
+    path = tmp_path / "photo.jpg"
+    data = os.urandom(size)
+    path.write_bytes(data)
+
+    with barcode_reader._open_image(path) as image:
+        assert isinstance(image, memoryview) is mapped
+        assert bytes(barcode_reader._encode_image_b64(image)) == base64.b64encode(data)
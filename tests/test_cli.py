@@ -0,0 +1,110 @@
+"""Tests for the command line entry point."""
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from app import cli
+from app.barcode_reader import RecognizedBarcode
+
+
+class _FakeReader:
+    """Stands in for the shared reader; records the options of every scan."""
+
+    def __init__(self, credentials: dict, scans: list) -> None:
+        self.credentials = credentials
+        self._scans = scans
+
+    def scan_images(self, image_paths, **options):
+        paths = list(image_paths)
+        self._scans.append(dict(options, images=paths, credentials=self.credentials))
+        return [[RecognizedBarcode("4607001234567", "EAN13", 0.9)] for _ in paths]
+
+
+@pytest.fixture
+def scans(monkeypatch):
+    recorded: list = []
+
+    def shared(client_id, client_secret, *, base_url=None):
+        credentials = {"client_id": client_id, "client_secret": client_secret}
+        return _FakeReader(credentials, recorded)
+
+    monkeypatch.setattr(cli.BarcodeReader, "shared", staticmethod(shared))
+    return recorded
+
+
+@pytest.fixture(autouse=True)
+def _isolated_environment(monkeypatch):
+    for name in ("ASPOSE_CLIENT_ID", "ASPOSE_CLIENT_SECRET", "ASPOSE_DEBUG"):
+        monkeypatch.delenv(name, raising=False)
+    # main() reconfigures the root logger; put the test runner's handlers back afterwards.
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def _run(tmp_path, *args: str) -> int:
+    return cli.main([str(tmp_path / "label.png"), "--log-file", str(tmp_path / "cli.log"), *args])
+
+
+def test_parser_is_built_once():
+    assert cli.build_parser() is cli.build_parser()
+
+
+def test_repeated_runs_do_not_share_options(tmp_path, scans, capsys):
+    credentials = ("--client-id", "id", "--client-secret", "secret")
+
+    assert _run(tmp_path, *credentials, "--type", "QR", "--type", "EAN13", "--no-cache") == 0
+    assert capsys.readouterr().out == "EAN13: 4607001234567 (90.00%)\n"
+    assert _run(tmp_path, *credentials, "--json") == 0
+    assert json.loads(capsys.readouterr().out) == [
+        {"value": "4607001234567", "symbology": "EAN13", "confidence": 0.9}
+    ]
+
+    first, second = scans
+    assert first["barcode_types"] == ["QR", "EAN13"]
+    assert first["use_cache"] is False
+    assert second["barcode_types"] is None
+    assert second["use_cache"] is True
+
+
+def test_credentials_fall_back_to_environment_on_every_run(tmp_path, scans, monkeypatch):
+    monkeypatch.setenv("ASPOSE_CLIENT_ID", "first-id")
+    monkeypatch.setenv("ASPOSE_CLIENT_SECRET", "first-secret")
+    _run(tmp_path)
+
+    monkeypatch.setenv("ASPOSE_CLIENT_ID", "second-id")
+    monkeypatch.setenv("ASPOSE_CLIENT_SECRET", "second-secret")
+    _run(tmp_path)
+
+    assert [scan["credentials"] for scan in scans] == [
+        {"client_id": "first-id", "client_secret": "first-secret"},
+        {"client_id": "second-id", "client_secret": "second-secret"},
+    ]
+
+
+def test_command_line_credentials_take_precedence(tmp_path, scans, monkeypatch):
+    monkeypatch.setenv("ASPOSE_CLIENT_ID", "env-id")
+    monkeypatch.setenv("ASPOSE_CLIENT_SECRET", "env-secret")
+
+    _run(tmp_path, "--client-id", "cli-id")
+
+    assert scans[0]["credentials"] == {"client_id": "cli-id", "client_secret": "env-secret"}
+
+
+def test_missing_credentials_stop_before_scanning(tmp_path, scans, monkeypatch):
+    monkeypatch.setenv("ASPOSE_CLIENT_ID", "env-id")
+    _run(tmp_path, "--client-secret", "secret")
+    monkeypatch.delenv("ASPOSE_CLIENT_ID")
+
+    with pytest.raises(SystemExit, match="Missing credentials"):
+        _run(tmp_path, "--client-secret", "secret")
+
+    assert len(scans) == 1
@@ -0,0 +1,59 @@
+"""Tests for the buffered rotating log handler."""
+from __future__ import annotations
+
+import logging
+
+from app.logging_utils import _BufferedRotatingFileHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_rotates_during_a_run_once_max_bytes_is_reached(tmp_path):
+    path = tmp_path / "app.log"
+    handler = _BufferedRotatingFileHandler(
+        path, maxBytes=100, backupCount=2, encoding="utf-8", delay=True
+    )
+    try:
+        for index in range(10):
+            handler.emit(_record(f"line {index:02d} " + "x" * 30))
+    finally:
+        handler.close()
+
+    assert path.stat().st_size <= 100
+    assert (tmp_path / "app.log.1").stat().st_size <= 100
+    assert (tmp_path / "app.log.2").exists()
+    assert not (tmp_path / "app.log.3").exists()
+    assert path.read_text(encoding="utf-8").splitlines()[-1].startswith("line 09")
+
+
+def test_counts_encoded_bytes_of_non_ascii_records(tmp_path):
+    path = tmp_path / "app.log"
+    handler = _BufferedRotatingFileHandler(
+        path, maxBytes=60, backupCount=1, encoding="utf-8", delay=True
+    )
+    try:
+        # 20 Cyrillic characters take 40 bytes in UTF-8, so the second record must rotate.
+        handler.emit(_record("ж" * 20))
+        handler.emit(_record("ж" * 20))
+    finally:
+        handler.close()
+
+    assert path.read_text(encoding="utf-8") == "ж" * 20 + "\n"
+    assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == "ж" * 20 + "\n"
+
+
+def test_existing_file_size_is_taken_into_account(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("y" * 95 + "\n", encoding="utf-8")
+    handler = _BufferedRotatingFileHandler(
+        path, maxBytes=100, backupCount=1, encoding="utf-8", delay=True
+    )
+    try:
+        handler.emit(_record("fresh"))
+    finally:
+        handler.close()
+
+    assert path.read_text(encoding="utf-8") == "fresh\n"
+    assert (tmp_path / "app.log.1").read_text(encoding="utf-8") == "y" * 95 + "\n"
@@ -0,0 +1,47 @@
+"""Tests for the on-disk access token cache."""
+from __future__ import annotations
+
+import stat
+
+import pytest
+
+from app import token_cache
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(token_cache, "_TOKEN_CACHE_DIR", tmp_path)
+
+
+def test_client_ids_do_not_overwrite_each_other():
+    token_cache.store_token("first", "token-1")
+    token_cache.store_token("second", "token-2")
+
+    assert token_cache.load_token("first") == "token-1"
+    assert token_cache.load_token("second") == "token-2"
+
+
+def test_clear_only_removes_the_given_client(tmp_path):
+    token_cache.store_token("first", "token-1")
+    token_cache.store_token("second", "token-2")
+
+    token_cache.clear_token("first")
+
+    assert token_cache.load_token("first") is None
+    assert token_cache.load_token("second") == "token-2"
+
+
+def test_tokens_are_private_to_the_user(tmp_path):
+    token_cache.store_token("first", "token-1")
+
+    (path,) = tmp_path.iterdir()
+    assert path.name.startswith("token-") and "first" not in path.name
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_expired_token_is_ignored(monkeypatch):
+    token_cache.store_token("first", "token-1")
+    monkeypatch.setattr(token_cache, "_TOKEN_TTL", -1)
+    token_cache.store_token("first", "token-2")
+
+    assert token_cache.load_token("first") is None